@@ -1,41 +1,28 @@
 """A method to decode target values for a ROM stage environment."""
 
+from functools import lru_cache
 
-def decode_target(
-    target: tuple[int, int] | None, lost_levels: bool
-) -> tuple[int, int, int] | tuple[None, None, None]:
-    """Return the target area for target world and target stage.
+
+@lru_cache(maxsize=64, typed=True)
+def _decode_world_stage(
+    target_world: int, target_stage: int, lost_levels: bool
+) -> tuple[int, int, int]:
+    """Return the target area for a target world and target stage.
 
     Args:
-        target (tuple[int, int] | None): the target world and stage to load
-            as a tuple of (world, stage) or None if no target is specified
+        target_world (int): the target world to load
+        target_stage (int): the target stage to load
         lost_levels (bool): whether to use lost levels game
 
-    Returns tuple[int, int, int] | tuple[None, None, None]:
+    Returns tuple[int, int, int]:
         the area to target to load the target world and stage
 
-    """
-    # Type and value check the lost levels parameter
-    if not isinstance(lost_levels, bool):
-        raise TypeError(
-            f"lost_levels argument must be of type: bool. Got: {type(lost_levels).__name__}"
-        )
-    # if there is no target, the world, stage, and area targets are all None
-    if target is None:
-        return None, None, None
-
-    if not isinstance(target, (tuple, list)):
-        raise TypeError(
-            f"target argument must be of type tuple. Got: {type(target).__name__}."
-        )
-
-    if len(target) != 2:
-        raise ValueError(
-            f"target argument must contain exactly two integers. Got length: {len(target)}"
-        )
-    # unwrap the target world and stage
-    target_world, target_stage = target
+    Note:
+        results are cached because many environments are typically created
+        with the same target. `typed` keeps e.g. `1.0` from hitting the
+        cached result of `1` and skipping the type checks
 
+    """
     # Type and value check the target world parameter
     if not isinstance(target_world, int):
         raise TypeError("target_world must be of type: int")
@@ -74,5 +61,43 @@ def decode_target(
     return target_world, target_stage, target_area
 
 
+def decode_target(
+    target: tuple[int, int] | None, lost_levels: bool
+) -> tuple[int, int, int] | tuple[None, None, None]:
+    """Return the target area for target world and target stage.
+
+    Args:
+        target (tuple[int, int] | None): the target world and stage to load
+            as a tuple of (world, stage) or None if no target is specified
+        lost_levels (bool): whether to use lost levels game
+
+    Returns tuple[int, int, int] | tuple[None, None, None]:
+        the area to target to load the target world and stage
+
+    """
+    # Type and value check the lost levels parameter
+    if not isinstance(lost_levels, bool):
+        raise TypeError(
+            f"lost_levels argument must be of type: bool. Got: {type(lost_levels).__name__}"
+        )
+    # if there is no target, the world, stage, and area targets are all None
+    if target is None:
+        return None, None, None
+
+    if not isinstance(target, (tuple, list)):
+        raise TypeError(
+            f"target argument must be of type tuple. Got: {type(target).__name__}."
+        )
+
+    if len(target) != 2:
+        raise ValueError(
+            f"target argument must contain exactly two integers. Got length: {len(target)}"
+        )
+    # unwrap the target world and stage
+    target_world, target_stage = target
+
+    return _decode_world_stage(target_world, target_stage, lost_levels)
+
+
 # explicitly define the outward facing API of this module
 __all__ = [decode_target.__name__]  # pyright: ignore [reportUnsupportedDunderAll]
@@ -1,6 +1,7 @@
 """A method to load a ROM path."""
 
 import os
+from functools import lru_cache
 
 # a dictionary mapping ROM paths first by lost levels, then by ROM hack mode
 _ROM_PATHS = {
@@ -19,6 +20,7 @@ _ROM_PATHS = {
 }
 
 
+@lru_cache(maxsize=8, typed=True)
 def rom_path(lost_levels, rom_mode):
     """Return the ROM filename for a game and ROM mode.
 
@@ -33,6 +35,11 @@ def rom_path(lost_levels, rom_mode):
     Returns (str):
         the ROM path based on the input parameters
 
+    Note:
+        results are cached because many environments are typically created
+        with the same arguments. `typed` keeps `1` from hitting the cached
+        result of `True` and skipping the type check
+
     """
     # Type and value check the lost levels parameter
     if not isinstance(lost_levels, bool):
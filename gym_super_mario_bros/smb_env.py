@@ -1,30 +1,156 @@
 """An OpenAI Gym environment for Super Mario Bros. and Lost Levels."""
 
-from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 
 import numpy as np
 from nes_py import NESEnv  # pyright: ignore[reportMissingImports]
 
 from ._roms import decode_target, rom_path
 
-# create a dictionary mapping value of status register to string names
-_STATUS_MAP = defaultdict(lambda: "fireball", {0: "small", 1: "tall"})
+# the string names of the status register values, any value of 2 or more is
+# "fireball"
+_STATUS = ("small", "tall", "fireball")
 
 
 # a set of state values indicating that Mario is "busy"
-_BUSY_STATES = [0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x07]
+_BUSY_STATES = (0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x07)
 
 
-# RAM addresses for enemy types on the screen
-_ENEMY_TYPE_ADDRESSES = [0x0016, 0x0017, 0x0018, 0x0019, 0x001A]
+# a bitmask with the bit of each busy state set, i.e., 0b10111111
+_BUSY_MASK = sum(1 << state for state in _BUSY_STATES)
+
+
+# RAM addresses for enemy types on the screen (0x0016 to 0x001A)
+_ENEMY_TYPE_ADDRESSES = slice(0x0016, 0x001B)
 
 
 # enemies whose context indicate that a stage change will occur (opposed to an
 # enemy that implies a stage change won't occur -- i.e., a vine)
-# Bowser = 0x2D
-# Flagpole = 0x31
-_STAGE_OVER_ENEMIES = np.array([0x2D, 0x31])
+_BOWSER = 0x2D
+_FLAGPOLE = 0x31
+
+
+def _pow10(length):
+    """Return the weight of each digit in a figure with `length` 10's places."""
+    return np.array([10 ** (length - 1 - i) for i in range(length)], dtype=np.int32)
+
+
+# a cache mapping the number of 10's places of a figure to the weight of each
+# digit, i.e., 3 => [100, 10, 1]. coins, time, and score are precomputed
+_POW10_CACHE: dict[int, np.ndarray] = {length: _pow10(length) for length in (2, 3, 6)}
+
+
+def _block_pow10(lengths):
+    """Return a block diagonal matrix of the weights of several figures' digits.
+
+    Args:
+        lengths (tuple): the number of 10's places of each figure
+
+    Returns:
+        a matrix whose product with the concatenated digits of the figures is
+        the vector of their values
+
+    """
+    weights = np.zeros((len(lengths), sum(lengths)), dtype=np.int32)
+    start = 0
+    for row, length in enumerate(lengths):
+        weights[row, start : start + length] = _pow10(length)
+        start += length
+    return weights
+
+
+# the address and number of 10's places of the score, time, and coins figures
+_SCORE_FIGURE = (0x07DE, 6)
+_TIME_FIGURE = (0x07F8, 3)
+_COINS_FIGURE = (0x07ED, 2)
+_INFO_FIGURES = (_SCORE_FIGURE, _TIME_FIGURE, _COINS_FIGURE)
+
+
+# the addresses of every digit of the score, time, and coins figures
+_INFO_DIGIT_ADDRESSES = np.concatenate(
+    [np.arange(address, address + length) for address, length in _INFO_FIGURES]
+)
+
+
+# the weights of the digits at the addresses above, the product of the two is
+# (score, time, coins)
+_INFO_DIGIT_WEIGHTS = _block_pow10([length for _, length in _INFO_FIGURES])
+
+
+class _Info(Mapping):
+    """The info after a step occurs as a mapping with slots.
+
+    Note:
+        fields are read as attributes (e.g., `info.x_pos`) or as keys (e.g.,
+        `info["x_pos"]`). `dict(info)` builds the equivalent dictionary
+
+    """
+
+    __slots__ = (
+        "coins",
+        "flag_get",
+        "life",
+        "score",
+        "stage",
+        "status",
+        "time",
+        "world",
+        "x_pos",
+        "y_pos",
+        "x_speed",
+        "y_speed",
+    )
+
+    def __init__(
+        self,
+        coins,
+        flag_get,
+        life,
+        score,
+        stage,
+        status,
+        time,
+        world,
+        x_pos,
+        y_pos,
+        x_speed,
+        y_speed,
+    ):
+        """Initialize a new info with a value for each field."""
+        self.coins = coins
+        self.flag_get = flag_get
+        self.life = life
+        self.score = score
+        self.stage = stage
+        self.status = status
+        self.time = time
+        self.world = world
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.x_speed = x_speed
+        self.y_speed = y_speed
+
+    def __getitem__(self, key):
+        """Return the value of a field by name."""
+        if key not in _INFO_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        """Return an iterator over the field names."""
+        return iter(self.__slots__)
+
+    def __len__(self):
+        """Return the number of fields."""
+        return len(self.__slots__)
+
+    def __repr__(self):
+        """Return a string representation of the fields and values."""
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+# the set of keys of the info for constant time membership tests
+_INFO_KEYS = frozenset(_Info.__slots__)
 
 
 class SuperMarioBrosEnv(NESEnv):
@@ -40,6 +166,7 @@ class SuperMarioBrosEnv(NESEnv):
         target: tuple[int, int] | None = None,
         max_episode_steps: int | None = None,
         truncate_function: Callable | None = None,
+        lightweight_info: bool = False,
     ):
         """Initialize a new Super Mario Bros environment.
 
@@ -54,11 +181,19 @@ class SuperMarioBrosEnv(NESEnv):
             - self: the environment instance (to possibly access / add instance variables)
             - reward: the reward received from the last step
             - info: the info dictionary returned from the last step
+            lightweight_info (bool): whether to return the info as a mapping
+                with slots instead of a dictionary. It is cheaper to create
+                each step but is not a `dict`, so gym's environment checker
+                must be disabled (i.e., `disable_env_checker=True`)
 
         Returns:
             None
 
         """
+        # whether to return the info as a mapping with slots
+        self._lightweight_info = lightweight_info
+        # setup a cache of RAM values that are read several times per frame
+        self._frame_cache = {}
         # decode the ROM path based on mode and lost levels flag
         rom = rom_path(lost_levels, rom_mode)
         # initialize the super object with the ROM path
@@ -71,6 +206,11 @@ class SuperMarioBrosEnv(NESEnv):
         self._target_world, self._target_stage, self._target_area = decode_target(
             target, lost_levels
         )
+        # whether this environment is a stage environment. the targets never
+        # change so the flag is resolved once here
+        self._is_single_stage_env = (
+            self._target_world is not None and self._target_area is not None
+        )
         # setup a variable to keep track of the last frames time
         self._time_last = 0
 
@@ -84,10 +224,44 @@ class SuperMarioBrosEnv(NESEnv):
     @property
     def is_single_stage_env(self):
         """Return True if this environment is a stage environment."""
-        return self._target_world is not None and self._target_area is not None
+        return self._is_single_stage_env
 
     # MARK: Memory access
 
+    def _invalidate_cache(self):
+        """Clear the RAM values cached for the current frame."""
+        self._frame_cache.clear()
+
+    def _snap(self, key, fn):
+        """Return a RAM value for the current frame, computing it on first use.
+
+        Args:
+            key (str): the key to cache the value with
+            fn (Callable): a function to compute the value if it isn't cached
+
+        Returns:
+            the value computed by `fn` for the current frame
+
+        """
+        cache = self._frame_cache
+        if key not in cache:
+            cache[key] = fn()
+        return cache[key]
+
+    def _frame_advance(self, action):
+        """Advance a frame in the emulator with an action.
+
+        Args:
+            action (byte): the action to press on the joy-pad
+
+        Returns:
+            None
+
+        """
+        super()._frame_advance(action)
+        # the RAM has changed, values from the last frame are stale
+        self._invalidate_cache()
+
     def _read_mem_range(self, address, length):
         """Read a range of bytes where each byte is a 10's place figure.
 
@@ -106,12 +280,13 @@ class SuperMarioBrosEnv(NESEnv):
             the integer value of this 10's place representation
 
         """
-        return int("".join(map(str, self.ram[address : address + length])))
-
-    @property
-    def _level(self):
-        """Return the level of the game."""
-        return self.ram[0x075F] * 4 + self.ram[0x075C]
+        # lookup the weights of each 10's place, computing them on first use
+        weights = _POW10_CACHE.get(length)
+        if weights is None:
+            weights = _POW10_CACHE[length] = _pow10(length)
+        # the figure is the dot product of the digits with their weights. the
+        # RAM slice is a view, the digits are not copied into a new array
+        return int(self.ram[address : address + length] @ weights)
 
     @property
     def _world(self):
@@ -128,23 +303,15 @@ class SuperMarioBrosEnv(NESEnv):
         """Return the current area number (1 to 5)."""
         return self.ram[0x0760] + 1
 
-    @property
-    def _score(self):
-        """Return the current player score (0 to 999990)."""
-        # score is represented as a figure with 6 10's places
-        return self._read_mem_range(0x07DE, 6)
-
     @property
     def _time(self):
         """Return the time left (0 to 999)."""
-        # time is represented as a figure with 3 10's places
-        return self._read_mem_range(0x07F8, 3)
+        return self._snap("time", self._compute_time)
 
-    @property
-    def _coins(self):
-        """Return the number of coins collected (0 to 99)."""
-        # coins are represented as a figure with 2 10's places
-        return self._read_mem_range(0x07ED, 2)
+    def _compute_time(self):
+        """Compute the time left from RAM."""
+        # time is represented as a figure with 3 10's places
+        return self._read_mem_range(*_TIME_FIGURE)
 
     @property
     def _life(self):
@@ -154,16 +321,19 @@ class SuperMarioBrosEnv(NESEnv):
     @property
     def _x_position(self):
         """Return the current horizontal position."""
+        return self._snap("x_position", self._compute_x_position)
+
+    def _compute_x_position(self):
+        """Compute the current horizontal position from RAM."""
         # add the current page 0x6d to the current x
         return int(self.ram[0x6D]) * 0x100 + int(self.ram[0x86])
 
     @property
     def _left_x_position(self):
         """Return the number of pixels from the left of the screen."""
-        # TODO: resolve RuntimeWarning: overflow encountered in ubyte_scalars
-        # subtract the left x position 0x071c from the current x 0x86
-        # return (self.ram[0x86] - self.ram[0x071c]) % 256
-        return np.uint8(int(self.ram[0x86]) - int(self.ram[0x071C])) % 256
+        # subtract the left x position 0x071c from the current x 0x86 and wrap
+        # the difference around to 8 bits
+        return (int(self.ram[0x86]) - int(self.ram[0x071C])) & 0xFF
 
     @property
     def _y_pixel(self):
@@ -181,11 +351,19 @@ class SuperMarioBrosEnv(NESEnv):
             up to 5 indicates falling into a hole
 
         """
+        return self._snap("y_viewport", self._compute_y_viewport)
+
+    def _compute_y_viewport(self):
+        """Compute the current y viewport from RAM."""
         return self.ram[0x00B5]
 
     @property
     def _y_position(self):
         """Return the current vertical position."""
+        return self._snap("y_position", self._compute_y_position)
+
+    def _compute_y_position(self):
+        """Compute the current vertical position from RAM."""
         # check if Mario is above the viewport (the score board area)
         if self._y_viewport < 1:
             # y position overflows so we start from 255 and add the offset
@@ -200,7 +378,7 @@ class SuperMarioBrosEnv(NESEnv):
     @property
     def _player_status(self):
         """Return the player status as a string."""
-        return _STATUS_MAP[self.ram[0x0756]]
+        return _STATUS[min(int(self.ram[0x0756]), 2)]
 
     @property
     def _player_state(self):
@@ -221,6 +399,10 @@ class SuperMarioBrosEnv(NESEnv):
             0x0C : Palette cycling, can't move
 
         """
+        return self._snap("player_state", self._compute_player_state)
+
+    def _compute_player_state(self):
+        """Compute the current player state from RAM."""
         return self.ram[0x000E]
 
     @property
@@ -243,7 +425,7 @@ class SuperMarioBrosEnv(NESEnv):
     @property
     def _is_busy(self):
         """Return boolean whether Mario is busy with in-game garbage."""
-        return self._player_state in _BUSY_STATES
+        return bool((_BUSY_MASK >> int(self._player_state)) & 1)
 
     @property
     def _is_world_over(self):
@@ -257,14 +439,18 @@ class SuperMarioBrosEnv(NESEnv):
     @property
     def _is_stage_over(self):
         """Return a boolean determining if the level is over."""
-        # iterate over the memory addresses that hold enemy types
-        for address in _ENEMY_TYPE_ADDRESSES:
-            # check if the byte is either Bowser (0x2D) or a flag (0x31)
-            # this is to prevent returning true when Mario is using a vine
-            # which will set the byte at 0x001D to 3
-            if self.ram[address] in _STAGE_OVER_ENEMIES:
-                # player float state set to 3 when sliding down flag pole
-                return self.ram[0x001D] == 3
+        return self._snap("is_stage_over", self._compute_is_stage_over)
+
+    def _compute_is_stage_over(self):
+        """Compute whether the level is over from RAM."""
+        # read the contiguous memory addresses that hold enemy types
+        enemies = self.ram[_ENEMY_TYPE_ADDRESSES]
+        # check if any byte is either Bowser (0x2D) or a flag (0x31)
+        # this is to prevent returning true when Mario is using a vine
+        # which will set the byte at 0x001D to 3
+        if ((enemies == _BOWSER) | (enemies == _FLAGPOLE)).any():
+            # player float state set to 3 when sliding down flag pole
+            return self.ram[0x001D] == 3
 
         return False
 
@@ -286,54 +472,71 @@ class SuperMarioBrosEnv(NESEnv):
             self.ram[0x075C] = self._target_stage - 1
             self.ram[0x0760] = self._target_area - 1
 
-    def _runout_prelevel_timer(self):
-        """Force the pre-level timer to 0 to skip frames during a death."""
-        self.ram[0x07A0] = 0
+    def _skip_all(self):
+        """Skip end of world, change area, and occupied state scenes.
 
-    def _skip_change_area(self):
-        """Skip change area animations by by running down timers."""
-        change_area_timer = self.ram[0x06DE]
-        if change_area_timer > 1 and change_area_timer < 255:
-            self.ram[0x06DE] = 1
+        Note:
+            the state bytes are read again before each skip because the skips
+            before it may have advanced the emulator. During normal play none
+            of the skips fire and this only costs a few comparisons
 
-    def _skip_occupied_states(self):
-        """Skip occupied states by running out a timer and skipping frames."""
+        """
+        # bind the RAM and frame advance locally for the duration of the loops
+        ram = self.ram
+        frame_advance = self._frame_advance
+        # skip the cutscene that plays at the end of a world. this must happen
+        # before the other skips
+        if self._is_world_over and not self._is_single_stage_env:
+            # get the current game time to reference
+            time = self._time
+            # loop until the time is different
+            while self._time == time:
+                # frame advance with NOP
+                frame_advance(0)
+        # skip area change (i.e. enter pipe, flag get, etc.) by running down
+        # the change area timer
+        if 1 < ram[0x06DE] < 255:
+            ram[0x06DE] = 1
+        # skip occupied states like the black screen between lives that shows
+        # how many lives the player has left
         while self._is_busy or self._is_world_over:
-            self._runout_prelevel_timer()
-            self._frame_advance(0)
+            # run-out the prelevel timer to skip frames
+            ram[0x07A0] = 0
+            frame_advance(0)
 
     def _skip_start_screen(self):
         """Press and release start to skip the start screen."""
+        # bind everything used in the loops locally, they can run for hundreds
+        # of frames
+        ram = self.ram
+        frame_advance = self._frame_advance
+        write_stage = self._write_stage
+        is_single_stage_env = self._is_single_stage_env
+        time_address, time_length = _TIME_FIGURE
+        time_digits = slice(time_address, time_address + time_length)
+        time_weights = _POW10_CACHE[time_length]
         # press and release the start button
-        self._frame_advance(8)
-        self._frame_advance(0)
-        # Press start until the game starts
-        while self._time == 0:
+        frame_advance(8)
+        frame_advance(0)
+        # Press start until the game starts (i.e., every digit of time is 0)
+        while not ram[time_digits].any():
             # press and release the start button
-            self._frame_advance(8)
+            frame_advance(8)
             # if we're in the single stage, environment, write the stage data
-            if self.is_single_stage_env:
-                self._write_stage()
-            self._frame_advance(0)
+            if is_single_stage_env:
+                write_stage()
+            frame_advance(0)
             # run-out the prelevel timer to skip the animation
-            self._runout_prelevel_timer()
+            ram[0x07A0] = 0
         # set the last time to now
-        self._time_last = self._time
+        time = time_last = int(ram[time_digits] @ time_weights)
         # after the start screen idle to skip some extra frames
-        while self._time >= self._time_last:
-            self._time_last = self._time
-            self._frame_advance(8)
-            self._frame_advance(0)
-
-    def _skip_end_of_world(self):
-        """Skip the cutscene that plays at the end of a world."""
-        if self._is_world_over:
-            # get the current game time to reference
-            time = self._time
-            # loop until the time is different
-            while self._time == time:
-                # frame advance with NOP
-                self._frame_advance(0)
+        while time >= time_last:
+            time_last = time
+            frame_advance(8)
+            frame_advance(0)
+            time = int(ram[time_digits] @ time_weights)
+        self._time_last = time_last
 
     def _kill_mario(self):
         """Skip a death animation by forcing Mario to death."""
@@ -384,6 +587,7 @@ class SuperMarioBrosEnv(NESEnv):
 
     def _did_reset(self):
         """Handle any RAM hacking after a reset occurs."""
+        self._invalidate_cache()
         self._time_last = self._time
         self.last_frame_x_position = self._x_position
         self.last_frame_y_position = self._y_position
@@ -401,17 +605,11 @@ class SuperMarioBrosEnv(NESEnv):
         # if will_reset flag is set a reset is incoming anyway, ignore any hacking
         if will_reset:
             return
-        # if mario is dying, then cut to the chase and kill hi,
+        # if mario is dying, then cut to the chase and kill him
         if self._is_dying:
             self._kill_mario()
-        # skip world change scenes (must call before other skip methods)
-        if not self.is_single_stage_env:
-            self._skip_end_of_world()
-        # skip area change (i.e. enter pipe, flag get, etc.)
-        self._skip_change_area()
-        # skip occupied states like the black screen between lives that shows
-        # how many lives the player has left
-        self._skip_occupied_states()
+        # skip world change, area change, and occupied scenes
+        self._skip_all()
 
     def _get_reward(self):
         """Return the reward after a step occurs."""
@@ -419,26 +617,55 @@ class SuperMarioBrosEnv(NESEnv):
 
     def _get_terminated(self):
         """Return True if the episode is over, False otherwise."""
-        if self.is_single_stage_env:
+        if self._is_single_stage_env:
             return self._is_dying or self._is_dead or self._flag_get
         return self._is_game_over
 
     def _get_info(self):
         """Return the info after a step occurs."""
-        return dict(
-            coins=self._coins,
-            flag_get=self._flag_get,
-            life=self._life,
-            score=self._score,
-            stage=self._stage,
-            status=self._player_status,
-            time=self._time,
-            world=self._world,
-            x_pos=self._x_position,
-            y_pos=self._y_position,
-            x_speed=self._x_position - self.last_frame_x_position,
-            y_speed=self._y_position - self.last_frame_y_position,
-        )
+        ram = self.ram
+        # decode the figures stored with one 10's place per byte with a single
+        # gather of their digits and a single product with their weights
+        score, time, coins = (_INFO_DIGIT_WEIGHTS @ ram[_INFO_DIGIT_ADDRESSES]).tolist()
+        # the positions were already computed for this frame by the reward
+        x_pos = self._x_position
+        y_pos = self._y_position
+        flag_get = self._flag_get
+        life = self._life
+        stage = self._stage
+        status = self._player_status
+        world = self._world
+        x_speed = x_pos - self.last_frame_x_position
+        y_speed = y_pos - self.last_frame_y_position
+        if self._lightweight_info:
+            return _Info(
+                coins,
+                flag_get,
+                life,
+                score,
+                stage,
+                status,
+                time,
+                world,
+                x_pos,
+                y_pos,
+                x_speed,
+                y_speed,
+            )
+        return {
+            "coins": coins,
+            "flag_get": flag_get,
+            "life": life,
+            "score": score,
+            "stage": stage,
+            "status": status,
+            "time": time,
+            "world": world,
+            "x_pos": x_pos,
+            "y_pos": y_pos,
+            "x_speed": x_speed,
+            "y_speed": y_speed,
+        }
 
     def step(self, action):
         """Run one frame of the NES and return the relevant observation data.
@@ -454,8 +681,13 @@ class SuperMarioBrosEnv(NESEnv):
             - truncated (boolean): whether the episode was truncated by either reaching the maximum number of steps or the truncate function returning True
             - info (dict): contains auxiliary diagnostic information
         """
+        # the RAM may have been written or restored since the last step without
+        # a frame advance, read the positions from RAM rather than the cache
+        self._invalidate_cache()
         self.last_frame_x_position = self._x_position
         self.last_frame_y_position = self._y_position
+        # the emulator is about to advance, invalidate the cached RAM values
+        self._invalidate_cache()
         return super().step(action)
 
 
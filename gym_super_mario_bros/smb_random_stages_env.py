@@ -99,6 +99,7 @@ class SuperMarioBrosRandomStagesEnv(gym.Env):
         stages: StageTuple = (set(), set()),
         max_episode_steps: int | None = None,
         truncate_function: Callable | None = None,
+        lightweight_info: bool = False,
     ):
         """Initialize a new Random Stage Super Mario Bros environment.
 
@@ -113,6 +114,7 @@ class SuperMarioBrosRandomStagesEnv(gym.Env):
             - self: the environment instance (to possibly access / add instance variables)
             - reward: the reward received from the last step
             - info: the info dictionary returned from the last step
+            lightweight_info (bool): whether to return the info as a mapping with slots instead of a dictionary.
 
         Returns:
             None
@@ -155,6 +157,7 @@ class SuperMarioBrosRandomStagesEnv(gym.Env):
                     target=target,
                     max_episode_steps=max_episode_steps,
                     truncate_function=truncate_function,
+                    lightweight_info=lightweight_info,
                 )
 
         if random_mode.has_lost_levels:
@@ -172,6 +175,7 @@ class SuperMarioBrosRandomStagesEnv(gym.Env):
                     target=target,
                     max_episode_steps=max_episode_steps,
                     truncate_function=truncate_function,
+                    lightweight_info=lightweight_info,
                 )
         # get the first env of the dictionary using the first key of the pool
         self.env = self.envs[self.stage_pool_keys[0]]
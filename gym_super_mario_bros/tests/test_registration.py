@@ -1,531 +1,176 @@
 """Test cases for the gym registered environments."""
 
-from unittest import TestCase
+from dataclasses import asdict, dataclass
+
+import pytest
 
 from .._registration import make
 from ..enums import SuperMarioBrosRandomMode, SuperMarioBrosROMMode
 
+# every test of this module steps a NES emulator
+pytestmark = pytest.mark.slow_env
+
+# the capitalized ROM modes of Super Mario Bros, as used in the env IDs
+_ROM_MODES = tuple(SuperMarioBrosROMMode.capitalized_rom_modes())
+# the capitalized ROM modes of Super Mario Bros 2 (Lost Levels)
+_LL_MODES = tuple(SuperMarioBrosROMMode.capitalized_lost_levels_values())
+
 
-class ShouldMakeEnv:
-    """A test case for making an arbitrary environment."""
+@dataclass(frozen=True, slots=True)
+class _InitialState:
+    """The expected state of the info after the first step of an environment."""
 
     # the number of coins at the start
-    coins = 0
+    coins: int = 0
     # whether flag get is thrown
-    flag_get = False
+    flag_get: bool = False
     # the number of lives left
-    life = 2
+    life: int = 2
     # the current world
-    world = 1
+    world: int = 1
     # the current score
-    score = 0
+    score: int = 0
     # the current stage
-    stage = 1
+    stage: int = 1
     # the amount of time left
-    time = 400
+    time: int = 400
     # the x position of Mario
-    x_pos = 40
-    # the environments ID
-    env_id = None
-    # the random seed to apply
-    seed = None
-    # the subset of stages to sample from
-    stages = None
-
-    def _test_env(self, env_id, stages):
-        if stages is not None:
-            env = make(env_id, stages=stages)
-        else:
-            env = make(env_id)
-        env.reset(seed=self.seed)
-        s, r, d, t, i = env.step(0)
-        self.assertEqual(self.coins, i["coins"])
-        self.assertEqual(self.flag_get, i["flag_get"])
-        self.assertEqual(self.life, i["life"])
-        self.assertEqual(self.world, i["world"])
-        self.assertEqual(self.score, i["score"])
-        self.assertEqual(self.stage, i["stage"])
-        self.assertEqual(self.time, i["time"])
-        self.assertEqual(self.x_pos, i["x_pos"])
-        env.close()
-
-    def test(self):
-        if isinstance(self.env_id, str):
-            self._test_env(self.env_id, self.stages)
-        elif isinstance(self.env_id, list):
-            for env_id in self.env_id:
-                self._test_env(env_id, self.stages)
-
-
-class ShouldMakeSuperMarioBros(ShouldMakeEnv, TestCase):
-    # the environments ID for all VERSIONS of Super Mario Bros
-    env_id = [
-        f"SuperMarioBros-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBrosRandomStagesSmbOnly(ShouldMakeEnv, TestCase):
-    # the random number seed for this environment
-    seed = 1
-    # the amount of time left
-    time = 400
-    # the current world
-    world = 4
-    # the current stage
-    stage = 4
-    # the environments ID for all VERSIONS of Super Mario Bros
-
-    env_id = []
-    random_mode = SuperMarioBrosRandomMode.SMB_ONLY.value
-    for rom_mode in SuperMarioBrosROMMode.capitalized_rom_modes():
-        env_id.append(f"SuperMarioBrosRandomStages-{rom_mode}-{random_mode}")
-
-
-class ShouldMakeSuperMarioBrosRandomStagesLostLevelsOnly(ShouldMakeEnv, TestCase):
-    # the random number seed for this environment
-    seed = 1
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 2
-    # the current stage
-    stage = 4
-    # the environments ID for all VERSIONS of Super Mario Bros
-
-    env_id = []
-    random_mode = SuperMarioBrosRandomMode.LOST_LEVELS_ONLY.value
-    for rom_mode in SuperMarioBrosROMMode.capitalized_lost_levels_values():
-        env_id.append(f"SuperMarioBrosRandomStages-{rom_mode}-{random_mode}")
-
-
-class ShouldMakeSuperMarioBrosRandomStagesBoth(ShouldMakeEnv, TestCase):
-    # the random number seed for this environment
-    seed = 1
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 6
-    # the current stage
-    stage = 3
-    # the environments ID for all VERSIONS of Super Mario Bros
-
-    env_id = []
-    random_mode = SuperMarioBrosRandomMode.BOTH.value
-    for rom_mode in SuperMarioBrosROMMode.capitalized_lost_levels_values():
-        env_id.append(f"SuperMarioBrosRandomStages-{rom_mode}-{random_mode}")
-
-
-class ShouldMakeSuperMarioBrosLostLevels(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 400
-    # the environments ID for all VERSIONS of Super Mario Bros
-    env_id = [
-        f"SuperMarioBros2-{v}"
-        for v in SuperMarioBrosROMMode.capitalized_lost_levels_values()
-    ]
-
-
-class ShouldMakeSuperMarioBros_1_1(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 1
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-1-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_1_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 1
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-1-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_1_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 1
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-1-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_1_4(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 1
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-1-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_2_1(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 2
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-2-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_2_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 2
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-2-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_2_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 2
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-2-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_2_4(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 2
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-2-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_3_1(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 3
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-3-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_3_2(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 3
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-3-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_3_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 3
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-3-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_3_4(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 3
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-3-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_4_1(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 4
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-4-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_4_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 4
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-4-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_4_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 4
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-4-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_4_4(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 4
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-4-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_5_1(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 5
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-5-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_5_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 5
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-5-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_5_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 5
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-5-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_5_4(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 5
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-5-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_6_1(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 6
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-6-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_6_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 6
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-6-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_6_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 6
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-6-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_6_4(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 6
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-6-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_7_1(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 7
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-7-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_7_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 7
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-7-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_7_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 7
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-7-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_7_4(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 7
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-7-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_8_1(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 8
-    # the current stage
-    stage = 1
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-8-1-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_8_2(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 8
-    # the current stage
-    stage = 2
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-8-2-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_8_3(ShouldMakeEnv, TestCase):
-    # the amount of time left
-    time = 300
-    # the current world
-    world = 8
-    # the current stage
-    stage = 3
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-8-3-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBros_8_4(ShouldMakeEnv, TestCase):
-    # the current world
-    world = 8
-    # the current stage
-    stage = 4
-    # the environments ID
-    env_id = [
-        f"SuperMarioBros-8-4-{v}" for v in SuperMarioBrosROMMode.capitalized_rom_modes()
-    ]
-
-
-class ShouldMakeSuperMarioBrosRandomStagesSubset(ShouldMakeEnv, TestCase):
-    # the random number seed for this environment
-    seed = 1
-    # the amount of time left
-    time = 400
-    # the current world
-    world = 4
-    # the current stage
-    stage = 2
-    # the stages to sample from
-    stages = ({(4, 2)}, {(4, 2)})
-    # the environments ID for all VERSIONS of Super Mario Bros
-    env_id = []
-    for random_mode in SuperMarioBrosRandomMode:
-        for rom_mode in SuperMarioBrosROMMode:
-            if random_mode.has_lost_levels and not rom_mode.suitable_for_lost_levels:
-                continue
-            env_id.append(
-                f"SuperMarioBrosRandomStages-{rom_mode.value.capitalize()}-{random_mode.value}"
-            )
+    x_pos: int = 40
+
+
+def _assert_env_initial_state(env_id, expected, stages=None, seed=None):
+    """Assert the info of the first step of an environment.
+
+    Args:
+        env_id (str): the ID of the environment to check
+        expected (_InitialState): the expected state of the info
+        stages (tuple): the subset of stages to sample from, if any
+        seed (int): the random seed to reset the environment with
+
+    Returns:
+        None
+
+    """
+    if stages is not None:
+        env = make(env_id, stages=stages)
+    else:
+        env = make(env_id)
+    env.reset(seed=seed)
+    s, r, d, t, i = env.step(0)
+    env.close()
+    expected = asdict(expected)
+    assert expected == {key: i[key] for key in expected}
+
+
+@pytest.mark.parametrize("env_id", [f"SuperMarioBros-{v}" for v in _ROM_MODES])
+def test_super_mario_bros(env_id):
+    _assert_env_initial_state(env_id, _InitialState())
+
+
+@pytest.mark.parametrize(
+    "env_id",
+    [
+        f"SuperMarioBrosRandomStages-{v}-{SuperMarioBrosRandomMode.SMB_ONLY.value}"
+        for v in _ROM_MODES
+    ],
+)
+def test_super_mario_bros_random_stages_smb_only(env_id):
+    _assert_env_initial_state(env_id, _InitialState(world=4, stage=4), seed=1)
+
+
+@pytest.mark.parametrize(
+    "env_id",
+    [
+        f"SuperMarioBrosRandomStages-{v}-{SuperMarioBrosRandomMode.LOST_LEVELS_ONLY.value}"
+        for v in _LL_MODES
+    ],
+)
+def test_super_mario_bros_random_stages_lost_levels_only(env_id):
+    _assert_env_initial_state(env_id, _InitialState(world=2, stage=4, time=300), seed=1)
+
+
+@pytest.mark.parametrize(
+    "env_id",
+    [
+        f"SuperMarioBrosRandomStages-{v}-{SuperMarioBrosRandomMode.BOTH.value}"
+        for v in _LL_MODES
+    ],
+)
+def test_super_mario_bros_random_stages_both(env_id):
+    _assert_env_initial_state(env_id, _InitialState(world=6, stage=3, time=300), seed=1)
+
+
+@pytest.mark.parametrize("env_id", [f"SuperMarioBros2-{v}" for v in _LL_MODES])
+def test_super_mario_bros_lost_levels(env_id):
+    _assert_env_initial_state(env_id, _InitialState())
+
+
+# the stages that start with 300 units of time instead of 400
+_TIME_300 = frozenset(
+    {
+        (1, 3),
+        (1, 4),
+        (2, 3),
+        (2, 4),
+        (3, 2),
+        (3, 3),
+        (3, 4),
+        (4, 3),
+        (5, 1),
+        (5, 3),
+        (5, 4),
+        (6, 3),
+        (6, 4),
+        (7, 3),
+        (8, 1),
+        (8, 3),
+    }
+)
+
+
+def _expected_time(world, stage):
+    """Return the amount of time left at the start of a stage."""
+    return 300 if (world, stage) in _TIME_300 else 400
+
+
+# the env ID, world, stage, and amount of time left of each stage environment
+_STAGE_ENVS = [
+    (
+        f"SuperMarioBros-{world}-{stage}-{rom_mode}",
+        world,
+        stage,
+        _expected_time(world, stage),
+    )
+    for world in range(1, 9)
+    for stage in range(1, 5)
+    for rom_mode in _ROM_MODES
+]
+
+
+@pytest.mark.parametrize(
+    "env_id,world,stage,time", _STAGE_ENVS, ids=[env[0] for env in _STAGE_ENVS]
+)
+def test_stage(env_id, world, stage, time):
+    _assert_env_initial_state(
+        env_id, _InitialState(world=world, stage=stage, time=time)
+    )
+
+
+# the env IDs of every random stages environment, skipping the ROM modes that
+# cannot load Super Mario Bros 2 (Lost Levels) stages
+_RANDOM_SUBSET_IDS = tuple(
+    f"SuperMarioBrosRandomStages-{rom_mode.value.capitalize()}-{random_mode.value}"
+    for random_mode in SuperMarioBrosRandomMode
+    for rom_mode in SuperMarioBrosROMMode
+    if rom_mode.suitable_for_lost_levels or not random_mode.has_lost_levels
+)
+
+
+@pytest.mark.parametrize("env_id", _RANDOM_SUBSET_IDS)
+def test_super_mario_bros_random_stages_subset(env_id):
+    _assert_env_initial_state(
+        env_id,
+        _InitialState(world=4, stage=2),
+        stages=({(4, 2)}, {(4, 2)}),
+        seed=1,
+    )
@@ -2,6 +2,8 @@
 
 from unittest import TestCase
 
+import pytest
+
 from ..smb_env import SuperMarioBrosEnv
 
 
@@ -44,6 +46,15 @@ class ShouldRaiseErrorOnInvalidTypeStage(TestCase):
         self.assertRaises(TypeError, SuperMarioBrosEnv, target=("foo", 1))
 
 
+@pytest.mark.slow_env
+class ShouldRaiseErrorOnFloatWorldAfterCachedIntWorld(TestCase):
+    def test(self):
+        # the decoded (1, 1) target is cached, 1.0 must not hit that entry
+        env = SuperMarioBrosEnv(target=(1, 1))
+        env.close()
+        self.assertRaises(TypeError, SuperMarioBrosEnv, target=(1.0, 1))
+
+
 class ShouldRaiseErrorOnBelowBoundsStage(TestCase):
     def test(self):
         self.assertRaises(ValueError, SuperMarioBrosEnv, target=(1, 0))
@@ -60,6 +71,7 @@ class ShouldRaiseErrorOnAboveBoundsStage(TestCase):
         )
 
 
+@pytest.mark.slow_env
 class ShouldStepGameEnv(TestCase):
     def test(self):
         env = SuperMarioBrosEnv()
@@ -80,6 +92,7 @@ class ShouldStepGameEnv(TestCase):
         env.close()
 
 
+@pytest.mark.slow_env
 class ShouldStepStageEnv(TestCase):
     def test(self):
         env = SuperMarioBrosEnv(target=(4, 2))
@@ -98,3 +111,33 @@ class ShouldStepStageEnv(TestCase):
         self.assertEqual(400, i["time"])
         self.assertEqual(40, i["x_pos"])
         env.close()
+
+
+@pytest.mark.slow_env
+class ShouldStepGameEnvWithLightweightInfo(TestCase):
+    def test(self):
+        env = SuperMarioBrosEnv(lightweight_info=True)
+        env.reset()
+        s, r, d, t, i = env.step(0)
+        self.assertNotIsInstance(i, dict)
+        self.assertEqual(0, i["coins"])
+        self.assertEqual(0, i.coins)
+        self.assertEqual(40, i["x_pos"])
+        self.assertEqual(40, i.x_pos)
+        self.assertEqual(400, dict(i)["time"])
+        self.assertNotIn("keys", i)
+        env.close()
+
+
+@pytest.mark.slow_env
+class ShouldWrapLeftXPosition(TestCase):
+    def test(self):
+        env = SuperMarioBrosEnv()
+        env.reset()
+        env.ram[0x86] = 30
+        env.ram[0x071C] = 20
+        self.assertEqual(10, env._left_x_position)
+        # Mario's x is left of the screen's left x, the difference wraps
+        env.ram[0x86] = 10
+        self.assertEqual(246, env._left_x_position)
+        env.close()